@@ -39,18 +39,26 @@ Structure:
 """
 
 import re
+import bisect
 import json
 import sys
 import os
+import functools
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Any
-from dataclasses import dataclass, field, asdict
+from typing import List, Dict, Optional, Tuple, Any, Callable, Set, Iterator
+from dataclasses import dataclass, field
 from enum import Enum
 
 from dotenv import load_dotenv
+import numpy as np
 import fitz  # PyMuPDF
 
+# Tight glyph boxes keep block y0 consistent with search_for() hits
+fitz.TOOLS.set_small_glyph_heights(True)
+
 # Load .env from script directory
 load_dotenv(Path(__file__).parent / '.env')
 from eyecite import get_citations, clean_text
@@ -60,6 +68,38 @@ from eyecite.models import (
     SupraCitation,
     IdCitation,
 )
+from eyecite.tokenizers import default_tokenizer
+
+# eyecite citation class -> our cite_type
+_CITE_TYPES = {
+    FullCaseCitation: 'full_case',
+    ShortCaseCitation: 'short_case',
+    IdCitation: 'id',
+    SupraCitation: 'supra',
+}
+
+# Use eyecite's Hyperscan tokenizer when available: it compiles all reporter
+# patterns into one database (cached on disk) instead of running each regex.
+try:
+    import hyperscan  # noqa: F401
+    from eyecite.tokenizers import HyperscanTokenizer
+    _HYPERSCAN_CACHE = os.path.expanduser('~/.cache/citecheck/hyperscan')
+    # eyecite creates only the last path component, not its parents
+    os.makedirs(_HYPERSCAN_CACHE, exist_ok=True)
+    _TOKENIZER = HyperscanTokenizer(cache_dir=_HYPERSCAN_CACHE)
+except (ImportError, OSError):  # OSError: cache dir not creatable
+    _TOKENIZER = default_tokenizer
+
+# orjson serializes the (large) parsed output several times faster
+try:
+    import orjson
+
+    def _dump_json(obj: Any, f) -> None:
+        f.write(orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode())
+except ImportError:
+    def _dump_json(obj: Any, f) -> None:
+        json.dump(obj, f, indent=2, ensure_ascii=False)
 
 
 # Legal abbreviations that don't end sentences
@@ -84,6 +124,13 @@ SIGNALS = [
 ]
 SIGNALS_SORTED = sorted(SIGNALS, key=len, reverse=True)
 
+# One alternation anchored at end of text; the leftmost hit is the longest signal
+_SIGNAL_BY_LOWER = {s.lower(): s for s in SIGNALS}
+_SIGNAL_LOWER = {s: s.lower() for s in SIGNALS}
+_RE_SIGNAL_END = re.compile(
+    '(?:' + '|'.join(re.escape(s) for s in sorted(_SIGNAL_BY_LOWER, key=len, reverse=True)) + r')\Z'
+)
+
 # Parenthetical verbs
 PAREN_VERBS = [
     'holding', 'stating', 'finding', 'noting', 'explaining', 'observing',
@@ -91,6 +138,43 @@ PAREN_VERBS = [
     'clarifying', 'reaffirming', 'affirming', 'reversing', 'quoting',
     'citing', 'discussing', 'describing', 'providing', 'defining',
 ]
+_PAREN_VERBS_TUPLE = tuple(v.lower() for v in PAREN_VERBS)  # for str.startswith
+
+# Trailing characters stripped from case names / proposition text
+_TRAIL_PUNCT = '.,;:'
+_TRAIL_PUNCT_DASH = '.,;:-– '
+
+# Precompiled regex patterns
+_RE_DASHES = re.compile(r'[—–]')
+_RE_CASE_NAME_V = re.compile(r'\s+v\.?\s+')  # "Plaintiff v. Defendant"
+_RE_SIC = re.compile(r'\s*\[sic\]\s*', re.IGNORECASE)
+_RE_LEADING_NUM = re.compile(r'^\d+\s+')
+_RE_CLEAN = re.compile(r'(\w+)-\s+(\w+)|\s+')  # hyphen at line break, or whitespace run
+_RE_INTRO_PUNCT = re.compile(r'[:;,—]\s*$')
+_RE_FIRST_INT = re.compile(r'(\d+)')
+_RE_QUOTE = re.compile(r'["\u201c][^"\u201d]{15,}["\u201d]')  # quoted text of 15+ chars
+_RE_CASES_BLOCK = re.compile(r'Cases\s*\n(.*?)(?:Statutes|Rules|Other|\Z)',
+                             re.DOTALL | re.IGNORECASE)
+_RE_HTML_TAG = re.compile(r'<[^>]+>')
+_RE_CL_CITE = re.compile(r'^\s*(\S+)\s+(.+?)\s+(\S+)\s*$')  # "184 S.W.3d 242" -> vol, reporter, page
+
+# Max concurrent CourtListener lookups
+CL_MAX_WORKERS = 16
+
+# Retries for rate-limited (429) or failing (5xx) CourtListener searches
+CL_MAX_RETRIES = 3
+CL_MAX_BACKOFF = 30  # seconds
+
+# Joins sentence units for a single eyecite pass (see _citations_by_unit)
+_UNIT_SEP = '\n\n'
+
+
+def _clean_replacement(match: re.Match) -> str:
+    """Rejoin a word hyphenated across a line break; collapse whitespace to one space."""
+    if match.group(1) is not None:
+        return match.group(1) + match.group(2)
+    return ' '
+
 
 # Wetslaw case law base directory
 WETSLAW_BASE = "/mnt/wetslaw/data/case.law"
@@ -136,7 +220,17 @@ REPORTER_SLUGS = {
     'Tex. Civ. App.': 'tex-civ-app',
 }
 
+# Per-slug (json, html) path templates under WETSLAW_BASE
+_PATH_TEMPLATES: Dict[str, Tuple[str, str]] = {
+    slug: (
+        f"{WETSLAW_BASE}/{slug}/{{vol}}/json/{{page}}-01.json",
+        f"{WETSLAW_BASE}/{slug}/{{vol}}/html/{{page}}-01.html",
+    )
+    for slug in set(REPORTER_SLUGS.values())
+}
+
 
+@functools.lru_cache(maxsize=128)
 def get_reporter_slug(reporter: str) -> Optional[str]:
     """Convert a reporter name to its directory slug."""
     return REPORTER_SLUGS.get(reporter)
@@ -153,13 +247,12 @@ def get_local_case_paths(volume: str, reporter: str, page: str) -> Tuple[Optiona
     if not slug:
         return None, None
 
+    json_tmpl, html_tmpl = _PATH_TEMPLATES[slug]
+
     # Pad page to 4 digits
     page_padded = page.zfill(4)
 
-    json_path = f"{WETSLAW_BASE}/{slug}/{volume}/json/{page_padded}-01.json"
-    html_path = f"{WETSLAW_BASE}/{slug}/{volume}/html/{page_padded}-01.html"
-
-    return json_path, html_path
+    return json_tmpl.format(vol=volume, page=page_padded), html_tmpl.format(vol=volume, page=page_padded)
 
 
 def check_local_case_exists(volume: str, reporter: str, page: str) -> Tuple[bool, bool]:
@@ -177,6 +270,34 @@ def check_local_case_exists(volume: str, reporter: str, page: str) -> Tuple[bool
     return json_exists, html_exists
 
 
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(path: str) -> None:
+    """Create a directory (once per process)."""
+    os.makedirs(path, exist_ok=True)
+
+
+def _atomic_write(path: str, write: Callable[[Any], None]) -> bool:
+    """
+    Write a text file via a temp file in the same directory, then rename it
+    into place so a failed download never leaves a partial cache entry.
+
+    Returns:
+        True if the file was written
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            write(f)
+        os.replace(tmp_path, path)
+        return True
+    except (IOError, OSError):
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        return False
+
+
 class CourtListenerClient:
     """Client for CourtListener API with caching."""
 
@@ -185,6 +306,13 @@ class CourtListenerClient:
     def __init__(self, api_token: Optional[str] = None):
         self.api_token = api_token or os.environ.get('COURTLISTENER_API_TOKEN')
         self._cache: Dict[str, Optional[Dict]] = {}
+        # Lookups that failed after retries (429/5xx, network errors); not
+        # cached as misses, but not retried again during this run either
+        self._failed: Set[str] = set()
+        # Reuse one connection pool for all API calls
+        self.session = requests.Session()
+        if self.api_token:
+            self.session.headers['Authorization'] = f"Token {self.api_token}"
 
     def lookup_citation(self, volume: str, reporter: str, page: str) -> Optional[Dict[str, Any]]:
         """Look up a citation and return the CourtListener search result."""
@@ -194,20 +322,36 @@ class CourtListenerClient:
         cache_key = f"{volume}|{reporter}|{page}"
         if cache_key in self._cache:
             return self._cache[cache_key]
+        if cache_key in self._failed:
+            return None
 
         # Build exact citation string with quotes
         cite_str = f'"{volume} {reporter} {page}"'
 
-        try:
-            response = requests.get(
-                self.SEARCH_URL,
-                headers={"Authorization": f"Token {self.api_token}"},
-                params={"type": "o", "citation": cite_str},
-                timeout=10,
-            )
+        for attempt in range(CL_MAX_RETRIES + 1):
+            try:
+                response = self.session.get(
+                    self.SEARCH_URL,
+                    params={"type": "o", "citation": cite_str},
+                    timeout=10,
+                )
+            except requests.RequestException:
+                self._failed.add(cache_key)
+                return None
+
+            # Rate limited or server error: back off and retry, never cache
+            if response.status_code == 429 or response.status_code >= 500:
+                if attempt == CL_MAX_RETRIES:
+                    self._failed.add(cache_key)
+                    return None
+                time.sleep(self._retry_delay(response, attempt))
+                continue
 
             if response.status_code == 200:
-                data = response.json()
+                try:
+                    data = response.json()
+                except json.JSONDecodeError:
+                    data = {}
                 if data.get('count', 0) > 0 and data.get('results'):
                     result = data['results'][0]
                     self._cache[cache_key] = result
@@ -216,32 +360,44 @@ class CourtListenerClient:
             self._cache[cache_key] = None
             return None
 
-        except (requests.RequestException, json.JSONDecodeError):
-            self._cache[cache_key] = None
-            return None
+        return None
+
+    @staticmethod
+    def _retry_delay(response: requests.Response, attempt: int) -> float:
+        """Seconds to wait before retrying: Retry-After if given, else exponential."""
+        retry_after = response.headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            return min(int(retry_after), CL_MAX_BACKOFF)
+        return min(2 ** attempt, CL_MAX_BACKOFF)
+
+    def is_cached(self, volume: str, reporter: str, page: str) -> bool:
+        """Whether this citation has been settled this run: cached, or failed."""
+        key = f"{volume}|{reporter}|{page}"
+        return key in self._cache or key in self._failed
 
     def batch_lookup(self, citations: List[Tuple[str, str, str]]) -> int:
         """
         Look up multiple citations (one request per citation, but with caching).
 
+        Uncached citations are looked up concurrently on a thread pool of up
+        to CL_MAX_WORKERS requests.
+
         Args:
             citations: List of (volume, reporter, page) tuples
 
         Returns:
-            Number of citations found
+            Number of newly looked-up citations found
         """
         if not self.api_token:
             return 0
 
-        found = 0
-        for vol, rep, page in citations:
-            cache_key = f"{vol}|{rep}|{page}"
-            if cache_key not in self._cache:
-                result = self.lookup_citation(vol, rep, page)
-                if result:
-                    found += 1
+        pending = [c for c in dict.fromkeys(citations) if not self.is_cached(*c)]
+        if not pending:
+            return 0
 
-        return found
+        with ThreadPoolExecutor(max_workers=min(CL_MAX_WORKERS, len(pending))) as executor:
+            results = executor.map(lambda c: self.lookup_citation(*c), pending)
+            return sum(1 for result in results if result)
 
     def get_case_name(self, volume: str, reporter: str, page: str) -> Optional[str]:
         """Get just the case name from CourtListener."""
@@ -256,9 +412,8 @@ class CourtListenerClient:
             return None
 
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"https://www.courtlistener.com/api/rest/v4/clusters/{cluster_id}/",
-                headers={"Authorization": f"Token {self.api_token}"},
                 timeout=30,
             )
             if response.status_code == 200:
@@ -273,9 +428,8 @@ class CourtListenerClient:
             return None
 
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"https://www.courtlistener.com/api/rest/v4/opinions/{opinion_id}/",
-                headers={"Authorization": f"Token {self.api_token}"},
                 timeout=30,
             )
             if response.status_code == 200:
@@ -314,10 +468,9 @@ class CourtListenerClient:
             return False, False
 
         # Ensure directories exist
-        os.makedirs(os.path.dirname(json_path), exist_ok=True)
-        os.makedirs(os.path.dirname(html_path), exist_ok=True)
+        _ensure_dir(os.path.dirname(json_path))
+        _ensure_dir(os.path.dirname(html_path))
 
-        json_saved = False
         html_saved = False
 
         # Get opinions
@@ -341,7 +494,7 @@ class CourtListenerClient:
                     if not op_text and op_html:
                         # Strip HTML tags to get plain text
                         import html as html_module
-                        op_text = re.sub(r'<[^>]+>', ' ', op_html)
+                        op_text = _RE_HTML_TAG.sub(' ', op_html)
                         op_text = html_module.unescape(op_text)
                         op_text = ' '.join(op_text.split())
 
@@ -382,35 +535,37 @@ class CourtListenerClient:
         }
 
         # Save JSON
-        try:
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(flp_json, f, indent=2, ensure_ascii=False)
-            json_saved = True
-        except (IOError, OSError):
-            pass
+        json_saved = _atomic_write(
+            json_path,
+            lambda f: _dump_json(flp_json, f),
+        )
 
-        # Build and save HTML
+        # Build and save HTML, streaming opinion parts straight to the file
         if html_parts:
-            html_content = f'''<section class="casebody" data-case-id="{cluster_id}" data-firstpage="{page}">
+            head = f'''<section class="casebody" data-case-id="{cluster_id}" data-firstpage="{page}">
   <section class="head-matter">
     <h4 class="parties">{cluster.get('case_name_full', cluster.get('case_name', ''))}</h4>
     <p class="court">{cluster.get('court', '')}</p>
     <p class="decisiondate">{cluster.get('date_filed', '')}</p>
   </section>
   <article class="opinion" data-type="majority">
-    {''.join(html_parts)}
+    '''
+            tail = '''
   </article>
 </section>'''
-            try:
-                with open(html_path, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
-                html_saved = True
-            except (IOError, OSError):
-                pass
+
+            def write_html(f):
+                f.write(head)
+                for part in html_parts:
+                    f.write(part)
+                f.write(tail)
+
+            html_saved = _atomic_write(html_path, write_html)
 
         return json_saved, html_saved
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_case_name(name: str) -> str:
     """
     Normalize a case name for comparison.
@@ -423,7 +578,7 @@ def normalize_case_name(name: str) -> str:
         return ""
 
     # Split on " v. " or " v "
-    parts = re.split(r'\s+v\.?\s+', name, maxsplit=1)
+    parts = _RE_CASE_NAME_V.split(name, maxsplit=1)
     if len(parts) != 2:
         return name.strip()
 
@@ -474,7 +629,7 @@ def get_cl_client(api_token: Optional[str] = None) -> CourtListenerClient:
     return _cl_client
 
 
-@dataclass
+@dataclass(slots=True)
 class Citation:
     text: str
     case_name: Optional[str]
@@ -489,14 +644,31 @@ class Citation:
     refers_to: Optional[str] = None  # for id. citations
     cl_record: Optional[Dict[str, Any]] = None  # Full CourtListener record
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-ready dict (field by field, no recursive copy)."""
+        return {
+            'text': self.text,
+            'case_name': self.case_name,
+            'volume': self.volume,
+            'reporter': self.reporter,
+            'page': self.page,
+            'pin_cite': self.pin_cite,
+            'cite_type': self.cite_type,
+            'span': [self.span[0], self.span[1]],
+            'signal': self.signal,
+            'parenthetical': self.parenthetical,
+            'refers_to': self.refers_to,
+            'cl_record': self.cl_record,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class Sentence:
     text: str
     citations: List[Citation] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Paragraph:
     para_type: str  # "body" or "block_quote"
     sentences: List[Sentence] = field(default_factory=list)
@@ -513,6 +685,24 @@ class BriefParser:
         self.doc = fitz.open(pdf_path)
         self._body_margin = None
         self._block_indent = None
+        self._page_cache: Dict[int, Tuple[Any, Any, str, List[tuple]]] = {}
+        self._margins_cache: Dict[Tuple[int, int], Tuple[Optional[int], Optional[int]]] = {}
+        self._cl_cache: Dict[Tuple[str, str, str], Optional[Dict]] = {}
+
+    def _page_layout(self, page_num: int) -> Tuple[Any, Any, str, List[tuple]]:
+        """
+        Get (page, textpage, text, blocks) for a page.
+
+        Builds a single TextPage per page and derives both the plain text and
+        the block layout from it, so repeated section scans don't re-parse.
+        """
+        layout = self._page_cache.get(page_num)
+        if layout is None:
+            page = self.doc[page_num]
+            textpage = page.get_textpage(flags=fitz.TEXTFLAGS_TEXT)
+            layout = (page, textpage, textpage.extractText(), textpage.extractBLOCKS())
+            self._page_cache[page_num] = layout
+        return layout
 
     def prefetch_citations(self, cl_client: CourtListenerClient) -> int:
         """
@@ -521,17 +711,21 @@ class BriefParser:
         This does a quick pass through the document to find all citations,
         then batches them to CourtListener in one request.
 
+        Without an API token nothing can be looked up, so this returns 0
+        immediately without reading the document or running eyecite.
+
         Returns:
             Number of citations found in CourtListener
         """
+        if not cl_client.api_token:
+            return 0
+
         # Get all text from document
-        full_text = ""
-        for page in self.doc:
-            full_text += page.get_text() + "\n"
+        full_text = "".join(self._page_layout(i)[2] + "\n" for i in range(len(self.doc)))
 
         # Normalize and extract citations with eyecite
         normalized = self.normalize_for_eyecite(full_text)
-        eyecite_cites = get_citations(normalized)
+        eyecite_cites = get_citations(normalized, tokenizer=_TOKENIZER)
 
         # Collect unique (volume, reporter, page) tuples
         cite_tuples = set()
@@ -552,7 +746,7 @@ class BriefParser:
         """Normalize text for eyecite processing."""
         # Convert em-dashes and en-dashes to spaced hyphens
         # This prevents eyecite from joining words across dashes
-        text = re.sub(r'[—–]', ' -- ', text)
+        text = _RE_DASHES.sub(' -- ', text)
         return clean_text(text, ['all_whitespace', 'underscores'])
 
     def find_section_by_prefix(self, start_prefix: str, end_headings: List[str]) -> Optional[Dict]:
@@ -566,8 +760,7 @@ class BriefParser:
         end_page = None
 
         for i in range(len(self.doc)):
-            page = self.doc[i]
-            text = page.get_text()
+            text = self._page_layout(i)[2]
             match = start_pattern.search(text)
             if match:
                 start_page = i
@@ -582,7 +775,7 @@ class BriefParser:
                 re.IGNORECASE | re.MULTILINE
             )
             for i in range(start_page, len(self.doc)):
-                if end_pattern.search(self.doc[i].get_text()):
+                if end_pattern.search(self._page_layout(i)[2]):
                     end_page = i
                     break
             if end_page:
@@ -609,8 +802,7 @@ class BriefParser:
         end_page = None
 
         for i in range(len(self.doc)):
-            page = self.doc[i]
-            text = page.get_text()
+            text = self._page_layout(i)[2]
             if start_pattern.search(text):
                 start_page = i
                 break
@@ -624,7 +816,7 @@ class BriefParser:
                 re.IGNORECASE | re.MULTILINE
             )
             for i in range(start_page, len(self.doc)):
-                if end_pattern.search(self.doc[i].get_text()):
+                if end_pattern.search(self._page_layout(i)[2]):
                     end_page = i
                     break
             if end_page:
@@ -642,20 +834,24 @@ class BriefParser:
 
     def _calculate_margins(self, start_page: int, end_page: int):
         """Calculate body margin and block quote indent from page layout."""
-        from collections import Counter
-        x0_counts = Counter()
+        cached = self._margins_cache.get((start_page, end_page))
+        if cached is not None:
+            self._body_margin, self._block_indent = cached
+            return
 
-        for page_num in range(start_page, end_page + 1):
-            page = self.doc[page_num]
-            blocks = page.get_text("blocks")
+        x0s = np.fromiter(
+            (round(block[0])
+             for page_num in range(start_page, end_page + 1)
+             for block in self._page_layout(page_num)[3]
+             if block[6] == 0 and len(block[4].strip()) > 30),
+            dtype=np.int32,
+        )
 
-            for block in blocks:
-                x0, y0, x1, y1, text, block_no, block_type = block
-                if block_type == 0 and text.strip() and len(text.strip()) > 30:
-                    x0_rounded = round(x0)
-                    x0_counts[x0_rounded] += 1
+        # Histogram of left edges, most frequent first
+        values, counts = np.unique(x0s, return_counts=True)
+        order = np.argsort(-counts, kind='stable')[:3]
+        most_common = [(int(values[k]), int(counts[k])) for k in order]
 
-        most_common = x0_counts.most_common(3)
         if len(most_common) >= 2:
             margins = sorted([m[0] for m in most_common[:2]])
             self._body_margin = margins[0]
@@ -664,6 +860,8 @@ class BriefParser:
             self._body_margin = most_common[0][0]
             self._block_indent = self._body_margin + 36  # ~0.5 inch
 
+        self._margins_cache[(start_page, end_page)] = (self._body_margin, self._block_indent)
+
     def extract_paragraphs(self, section: Dict) -> List[Dict]:
         """Extract paragraphs from section, identifying block quotes by indentation."""
         start_page = section['start_page']
@@ -673,23 +871,25 @@ class BriefParser:
 
         self._calculate_margins(start_page, end_page)
 
+        end_patterns = [
+            (end_heading, re.compile(
+                rf'^\s*{re.escape(end_heading)}\s*$',
+                re.IGNORECASE | re.MULTILINE
+            ))
+            for end_heading in end_headings
+        ]
+
         # First pass: collect all blocks with their positions
         all_blocks = []
         in_section = False
 
         for page_num in range(start_page, end_page + 1):
-            page = self.doc[page_num]
-            blocks = page.get_text("blocks")
-            page_text = page.get_text()
+            page, textpage, page_text, blocks = self._page_layout(page_num)
 
             # Check if we've hit end heading
-            for end_heading in end_headings:
-                end_pattern = re.compile(
-                    rf'^\s*{re.escape(end_heading)}\s*$',
-                    re.IGNORECASE | re.MULTILINE
-                )
+            for end_heading, end_pattern in end_patterns:
                 if end_pattern.search(page_text):
-                    end_y = self._find_text_y(page, end_heading)
+                    end_y = self._find_text_y(page, end_heading, textpage)
                     if end_y:
                         blocks = [b for b in blocks if b[1] < end_y]
 
@@ -698,7 +898,7 @@ class BriefParser:
                 heading_y = None
                 if start_pattern.search(page_text):
                     for match in start_pattern.finditer(page_text):
-                        heading_y = self._find_text_y(page, match.group().strip())
+                        heading_y = self._find_text_y(page, match.group().strip(), textpage)
                         break
                 if heading_y:
                     blocks = [b for b in blocks if b[1] > heading_y]
@@ -728,76 +928,58 @@ class BriefParser:
         # Second pass: identify block quotes vs body paragraphs
         # Block quotes are 2+ consecutive blocks ALL at indented level (>25pt from body)
         # First-line indents are single blocks at moderate indent (~20-40pt) followed by body
+        n = len(all_blocks)
+        if self._body_margin:
+            indents = np.array([b['x0'] for b in all_blocks], dtype=float) - self._body_margin
+        else:
+            indents = np.zeros(n)
+        is_indented = (indents > 25).tolist()
+        is_body = (indents <= 10).tolist()
+
+        # For each block, does the next block that is clearly indented or clearly
+        # body-level turn out to be indented? (Blocks in between are ignored.)
+        quote_follows = [False] * n
+        next_is_indented = False
+        for k in range(n - 1, -1, -1):
+            quote_follows[k] = next_is_indented
+            if is_indented[k]:
+                next_is_indented = True
+            elif is_body[k]:
+                next_is_indented = False
+
         paragraphs = []
         i = 0
 
-        while i < len(all_blocks):
-            block = all_blocks[i]
-            indent = block['x0'] - self._body_margin if self._body_margin else 0
-
-            # Check if this starts a block quote (significantly indented, 25+ pt)
-            if indent > 25:
-                # Look ahead to see if next blocks are also indented
-                quote_blocks = [block]
-                j = i + 1
-                while j < len(all_blocks):
-                    next_indent = all_blocks[j]['x0'] - self._body_margin if self._body_margin else 0
-                    if next_indent > 25:
-                        quote_blocks.append(all_blocks[j])
-                        j += 1
-                    else:
-                        break
-
-                # If 2+ consecutive indented blocks, it's a block quote
-                if len(quote_blocks) >= 2:
-                    paragraphs.append({
-                        'type': 'block_quote',
-                        'blocks': quote_blocks,
-                    })
-                    i = j
-                    continue
-                # Otherwise, single indented block - might be first-line indent
-                # Fall through to body handling
+        while i < n:
+            # 2+ consecutive indented blocks form a block quote
+            if is_indented[i] and i + 1 < n and is_indented[i + 1]:
+                j = i + 2
+                while j < n and is_indented[j]:
+                    j += 1
+                paragraphs.append({
+                    'type': 'block_quote',
+                    'blocks': all_blocks[i:j],
+                })
+                i = j
+                continue
 
-            # Body paragraph: collect blocks until we hit a definite block quote
-            body_blocks = [block]
+            # Body paragraph: collect blocks until one starts a block quote.
+            # A single indented block followed by body text is a first-line indent.
             j = i + 1
-            while j < len(all_blocks):
-                next_block = all_blocks[j]
-                next_indent = next_block['x0'] - self._body_margin if self._body_margin else 0
-
-                # Check if next block starts a block quote sequence
-                if next_indent > 25:
-                    # Look ahead to see if it's really a block quote
-                    k = j + 1
-                    is_block_quote = False
-                    while k < len(all_blocks):
-                        kth_indent = all_blocks[k]['x0'] - self._body_margin if self._body_margin else 0
-                        if kth_indent > 25:
-                            is_block_quote = True
-                            break
-                        elif kth_indent <= 10:
-                            # Next block is body - this indented block is just first-line indent
-                            break
-                        k += 1
-
-                    if is_block_quote:
-                        break  # End body paragraph here
-
-                body_blocks.append(next_block)
+            while j < n and not (is_indented[j] and quote_follows[j]):
                 j += 1
 
             paragraphs.append({
                 'type': 'body',
-                'blocks': body_blocks,
+                'blocks': all_blocks[i:j],
             })
             i = j
 
         return paragraphs
 
-    def _find_text_y(self, page, text: str) -> Optional[float]:
+    def _find_text_y(self, page, text: str, textpage=None) -> Optional[float]:
         """Find y position of text on page."""
-        results = page.search_for(text[:50])  # First 50 chars
+        results = page.search_for(text[:50], textpage=textpage)  # First 50 chars
         if results:
             return results[0].y0
         return None
@@ -866,7 +1048,8 @@ class BriefParser:
                                          last_full_cite: Optional[str] = None,
                                          last_cl_record: Optional[Dict] = None,
                                          full_cite_records: Optional[Dict[Tuple[str, str], Dict]] = None,
-                                         cl_client: Optional[CourtListenerClient] = None) -> Tuple[List[Citation], Optional[str], Optional[Dict], Dict[Tuple[str, str], Dict]]:
+                                         cl_client: Optional[CourtListenerClient] = None,
+                                         found: Optional[List[Tuple[int, int, Any]]] = None) -> Tuple[List[Citation], Optional[str], Optional[Dict], Dict[Tuple[str, str], Dict]]:
         """Extract citations from a sentence.
 
         Args:
@@ -875,30 +1058,28 @@ class BriefParser:
             last_cl_record: CL record of the immediately preceding citation (for id cites)
             full_cite_records: Dict mapping (volume, reporter) to CL record (for short cites)
             cl_client: CourtListener client for lookups
+            found: Pre-extracted (start, end, cite) tuples for this sentence
+                   (see _citations_by_unit); eyecite is run here if omitted
 
         Returns:
             Tuple of (citations, new_last_full_cite, new_last_cl_record, full_cite_records)
         """
         # Normalize for eyecite
         normalized = self.normalize_for_eyecite(sentence)
+        # Lowercased once for signal lookups (only if offsets stay aligned)
+        normalized_lower = normalized.lower()
+        if len(normalized_lower) != len(normalized):
+            normalized_lower = None
 
-        eyecite_cites = get_citations(normalized)
+        if found is None:
+            found = self._find_citations(normalized)
         citations = []
         new_last_full = last_full_cite
         new_last_cl_record = last_cl_record
         if full_cite_records is None:
             full_cite_records = {}
 
-        for cite in eyecite_cites:
-            start, end = cite.span()
-
-            # Get full span for case citations
-            if isinstance(cite, FullCaseCitation):
-                if cite.full_span_start is not None:
-                    start = cite.full_span_start
-                if cite.full_span_end is not None:
-                    end = cite.full_span_end
-
+        for start, end, cite in found:
             cite_text = normalized[start:end]
 
             # Get volume/reporter/page
@@ -910,16 +1091,7 @@ class BriefParser:
                 pin_cite = getattr(cite.metadata, 'pin_cite', None)
 
             # Determine citation type first
-            if isinstance(cite, FullCaseCitation):
-                cite_type = 'full_case'
-            elif isinstance(cite, ShortCaseCitation):
-                cite_type = 'short_case'
-            elif isinstance(cite, IdCitation):
-                cite_type = 'id'
-            elif isinstance(cite, SupraCitation):
-                cite_type = 'supra'
-            else:
-                cite_type = 'unknown'
+            cite_type = _CITE_TYPES.get(type(cite), 'unknown')
 
             # CL lookup strategy:
             # - Full cites: Look up on CourtListener API, store by (volume, reporter)
@@ -931,7 +1103,7 @@ class BriefParser:
             if cite_type == 'full_case':
                 # Only full cites get CL API lookup
                 if cl_client and volume and reporter and page:
-                    cl_record = cl_client.lookup_citation(volume, reporter, page)
+                    cl_record = self._lookup_cl(cl_client, volume, reporter, page)
                     if cl_record:
                         case_name = cl_record.get('caseName')
                         # Store for later short cite matching
@@ -952,11 +1124,11 @@ class BriefParser:
             if not case_name:
                 case_name = self._get_case_name(cite)
 
-            if isinstance(cite, FullCaseCitation) and case_name:
+            if cite_type == 'full_case' and case_name:
                 new_last_full = case_name
 
             # Check for signal before citation
-            signal = self._find_signal_before(normalized, start)
+            signal = self._find_signal_before(normalized, start, normalized_lower)
 
             # Check for parenthetical after citation
             parenthetical = self._find_parenthetical_after(normalized, end)
@@ -983,6 +1155,96 @@ class BriefParser:
 
         return citations, new_last_full, new_last_cl_record, full_cite_records
 
+    def _lookup_cl(self, cl_client: CourtListenerClient, volume: str, reporter: str,
+                   page: str) -> Optional[Dict]:
+        """Look up a citation on CourtListener, memoized per (volume, reporter, page)."""
+        key = (volume, reporter, page)
+        if key in self._cl_cache:
+            return self._cl_cache[key]
+        record = cl_client.lookup_citation(volume, reporter, page)
+        self._cl_cache[key] = record
+        return record
+
+    def _prefetch_cl(self, cl_client: CourtListenerClient, cites: List[Any]) -> None:
+        """
+        Look up eyecite citations on CourtListener in parallel.
+
+        Uncached lookups go through the client's concurrent batch_lookup;
+        results land in the same memo used by _lookup_cl.
+        """
+        keys = []
+        for cite in cites:
+            groups = getattr(cite, 'groups', None) or {}
+            key = (groups.get('volume'), groups.get('reporter'), groups.get('page'))
+            if all(key) and key not in self._cl_cache:
+                keys.append(key)
+        keys = list(dict.fromkeys(keys))
+        if not keys or not cl_client.api_token:
+            return
+
+        cl_client.batch_lookup(keys)
+        for key in keys:
+            # Settled by the batch (found, missing or failed): no network here
+            self._cl_cache[key] = cl_client.lookup_citation(*key)
+
+    def _find_citations(self, normalized: str) -> List[Tuple[int, int, Any]]:
+        """Run eyecite on normalized text, returning (start, end, cite) tuples.
+
+        Full case citations use their full span (case name through parenthetical).
+        """
+        found = []
+        for cite in get_citations(normalized, tokenizer=_TOKENIZER):
+            start, end = cite.span()
+
+            # Get full span for case citations
+            if isinstance(cite, FullCaseCitation):
+                if cite.full_span_start is not None:
+                    start = cite.full_span_start
+                if cite.full_span_end is not None:
+                    end = cite.full_span_end
+
+            found.append((start, end, cite))
+        return found
+
+    def _citations_by_unit(self, texts: List[str]) -> List[List[Tuple[int, int, Any]]]:
+        """
+        Run eyecite once over several normalized texts and split the results.
+
+        The texts are joined with a blank line. With a single space, "Id."
+        followed by "Id. at 461." merges into one IdCitation, and a full
+        citation's span swallows the period that ends its sentence; the blank
+        line stops eyecite's forward scans. Its backward case-name scan still
+        crosses it, though, so a unit with a citation whose full span starts
+        in an earlier unit is re-run on its own. Citations are assigned to
+        the text containing their core span, and spans are rebased (and
+        clipped) to be relative to that text.
+        """
+        offsets = []
+        pos = 0
+        for text in texts:
+            offsets.append(pos)
+            pos += len(text) + len(_UNIT_SEP)
+
+        by_unit: List[List[Tuple[int, int, Any]]] = [[] for _ in texts]
+        if not texts:
+            return by_unit
+
+        rerun = set()
+        for start, end, cite in self._find_citations(_UNIT_SEP.join(texts)):
+            idx = bisect.bisect_right(offsets, cite.span()[0]) - 1
+            base = offsets[idx]
+            if start < base:
+                # Case name picked up from a previous unit
+                rerun.add(idx)
+                continue
+            limit = base + len(texts[idx])
+            by_unit[idx].append((start - base, min(end, limit) - base, cite))
+
+        for idx in rerun:
+            by_unit[idx] = self._find_citations(texts[idx])
+
+        return by_unit
+
     def _get_case_name(self, cite) -> Optional[str]:
         """Extract clean case name from citation."""
         if not hasattr(cite, 'metadata') or not cite.metadata:
@@ -994,21 +1256,21 @@ class BriefParser:
         defendant = (cite.metadata.defendant or '').strip()
 
         # Clean plaintiff - remove trailing punctuation
-        plaintiff = plaintiff.rstrip('.,;:')
+        plaintiff = plaintiff.rstrip(_TRAIL_PUNCT)
 
         # Clean defendant - remove trailing citation info
         if defendant and ',' in defendant:
             defendant = defendant.split(',')[0].strip()
-        defendant = defendant.rstrip('.,;:')
+        defendant = defendant.rstrip(_TRAIL_PUNCT)
 
         # Handle [sic] annotations - they indicate misspelling, remove them
         # e.g., "Rodgriguez [sic]" -> "Rodgriguez"
-        plaintiff = re.sub(r'\s*\[sic\]\s*', '', plaintiff, flags=re.IGNORECASE)
-        defendant = re.sub(r'\s*\[sic\]\s*', '', defendant, flags=re.IGNORECASE)
+        plaintiff = _RE_SIC.sub('', plaintiff)
+        defendant = _RE_SIC.sub('', defendant)
 
         # Remove page numbers that bled into names (e.g., "40 State" -> "State")
-        plaintiff = re.sub(r'^\d+\s+', '', plaintiff)
-        defendant = re.sub(r'^\d+\s+', '', defendant)
+        plaintiff = _RE_LEADING_NUM.sub('', plaintiff)
+        defendant = _RE_LEADING_NUM.sub('', defendant)
 
         # Skip if plaintiff is just [sic] or empty after cleaning
         if not plaintiff or plaintiff.lower() == '[sic]':
@@ -1018,46 +1280,57 @@ class BriefParser:
             return f"{plaintiff} v. {defendant}"
         return plaintiff
 
-    def _find_signal_before(self, text: str, pos: int) -> Optional[str]:
-        """Find citation signal before position."""
+    def _find_signal_before(self, text: str, pos: int,
+                            text_lower: Optional[str] = None) -> Optional[str]:
+        """Find citation signal before position.
+
+        text_lower, if given, is text.lower() computed once by the caller so
+        each citation only slices it.
+        """
         lookback = min(pos, 30)
-        preceding = text[pos-lookback:pos].rstrip().lower()
+        if text_lower is not None:
+            preceding = text_lower[pos-lookback:pos].rstrip()
+        else:
+            preceding = text[pos-lookback:pos].rstrip().lower()
 
-        for signal in SIGNALS_SORTED:
-            if preceding.endswith(signal.lower()):
-                return signal
+        match = _RE_SIGNAL_END.search(preceding)
+        if match:
+            return _SIGNAL_BY_LOWER[match.group(0)]
         return None
 
     def _find_parenthetical_after(self, text: str, pos: int) -> Optional[str]:
         """Find explanatory parenthetical after citation."""
         search = text[pos:pos+200]
 
-        # Look for opening paren
-        match = re.match(r'\s*\(', search)
-        if not match:
+        # Look for opening paren (most citations aren't followed by one)
+        stripped = search.lstrip()
+        if not stripped.startswith('('):
             return None
 
-        paren_start = pos + match.end()
+        paren_start = pos + (len(search) - len(stripped)) + 1
         after_paren = text[paren_start:paren_start+50].lstrip().lower()
 
         # Check if starts with explanatory verb
-        is_explanatory = any(after_paren.startswith(v) for v in PAREN_VERBS)
+        is_explanatory = after_paren.startswith(_PAREN_VERBS_TUPLE)
         if not is_explanatory:
             return None
 
-        # Find matching close paren
+        # Find matching close paren, jumping from paren to paren
         depth = 1
         i = paren_start
-        while i < len(text) and depth > 0:
-            if text[i] == '(':
+        while depth > 0:
+            close = text.find(')', i)
+            if close == -1:
+                return None
+            opening = text.find('(', i, close)
+            if opening != -1:
                 depth += 1
-            elif text[i] == ')':
+                i = opening + 1
+            else:
                 depth -= 1
-            i += 1
+                i = close + 1
 
-        if depth == 0:
-            return text[paren_start:i-1].strip()
-        return None
+        return text[paren_start:i-1].strip()
 
     def parse_argument_section(self, cl_client: Optional[CourtListenerClient] = None) -> Dict:
         """Parse the argument section into structured JSON."""
@@ -1082,11 +1355,10 @@ class BriefParser:
         # Extract paragraphs with block quote detection
         raw_paragraphs = self.extract_paragraphs(section)
 
-        # Process each paragraph
+        # First pass: build paragraph structure and collect every unit
+        # (sentence or block quote) that needs citations, in document order
         paragraphs = []
-        last_full_cite = None
-        last_cl_record = None  # Track CL record for id cites (preceding citation)
-        full_cite_records = {}  # Map (volume, reporter) -> CL record for short cite matching
+        units = []  # (normalized text, dict receiving its citations)
 
         for raw_para in raw_paragraphs:
             para_text = ' '.join(b['text'] for b in raw_para['blocks'])
@@ -1100,37 +1372,31 @@ class BriefParser:
                     if last_body['sentences']:
                         last_sent = last_body['sentences'][-1]['text']
                         # Check if ends with intro punctuation
-                        if re.search(r'[:;,—]\s*$', last_sent):
+                        if _RE_INTRO_PUNCT.search(last_sent):
                             intro = last_sent
                             # Remove from previous paragraph
                             last_body['sentences'] = last_body['sentences'][:-1]
 
-                # Extract citations from block quote
-                citations, last_full_cite, last_cl_record, full_cite_records = self.extract_citations_from_sentence(
-                    para_text, last_full_cite, last_cl_record, full_cite_records, cl_client
-                )
-
                 para = {
                     'type': 'block_quote',
                     'intro': intro,
                     'text': para_text,
-                    'citations': [self._citation_to_dict(c) for c in citations],
+                    'citations': [],
                 }
+                units.append((self.normalize_for_eyecite(para_text), para))
             else:
                 # Body paragraph - segment into sentences
-                sentences_text = self.segment_sentences(para_text)
                 sentences = []
 
-                for sent_text in sentences_text:
+                for sent_text in self.segment_sentences(para_text):
                     # Normalize the sentence so spans are consistent
                     normalized_sent = self.normalize_for_eyecite(sent_text)
-                    citations, last_full_cite, last_cl_record, full_cite_records = self.extract_citations_from_sentence(
-                        normalized_sent, last_full_cite, last_cl_record, full_cite_records, cl_client
-                    )
-                    sentences.append({
+                    sent = {
                         'text': normalized_sent,
-                        'citations': [self._citation_to_dict(c) for c in citations],
-                    })
+                        'citations': [],
+                    }
+                    sentences.append(sent)
+                    units.append((normalized_sent, sent))
 
                 para = {
                     'type': 'body',
@@ -1139,6 +1405,28 @@ class BriefParser:
 
             paragraphs.append(para)
 
+        # Run eyecite once over the whole section
+        found_by_unit = self._citations_by_unit([text for text, _ in units])
+
+        # Resolve all full citations on CourtListener concurrently up front
+        if cl_client:
+            self._prefetch_cl(cl_client, [
+                cite for found in found_by_unit for _, _, cite in found
+                if isinstance(cite, FullCaseCitation)
+            ])
+
+        # Second pass: resolve citations in order (id./short cites depend on
+        # what came before, including intro sentences moved into block quotes)
+        last_full_cite = None
+        last_cl_record = None  # Track CL record for id cites (preceding citation)
+        full_cite_records = {}  # Map (volume, reporter) -> CL record for short cite matching
+
+        for (text, target), found in zip(units, found_by_unit):
+            citations, last_full_cite, last_cl_record, full_cite_records = self.extract_citations_from_sentence(
+                text, last_full_cite, last_cl_record, full_cite_records, cl_client, found
+            )
+            target['citations'] = [self._citation_to_dict(c) for c in citations]
+
         return {
             'argument': {
                 'start_page': section['start_page'] + 1,
@@ -1149,18 +1437,17 @@ class BriefParser:
 
     def _clean_text(self, text: str) -> str:
         """Clean text of common artifacts."""
-        # Merge hyphenated words at line breaks
-        text = re.sub(r'(\w+)-\s+(\w+)', r'\1\2', text)
-        # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        # Merge hyphenated words at line breaks and normalize whitespace
+        return _RE_CLEAN.sub(_clean_replacement, text).strip()
 
     def _citation_to_dict(self, cite: Citation) -> Dict:
-        """Convert Citation dataclass to dict."""
-        d = asdict(cite)
-        # Convert span tuple to list for JSON
-        d['span'] = list(d['span'])
-        return d
+        """
+        Convert Citation dataclass to dict.
+
+        Shallow: the CL record is shared with the client cache rather than
+        deep-copied, so callers must not mutate it in place.
+        """
+        return cite.to_dict()
 
     def extract_toa_cases(self, cl_client: Optional[CourtListenerClient] = None) -> List[str]:
         """Extract case names from Table of Authorities."""
@@ -1173,18 +1460,21 @@ class BriefParser:
             return []
 
         # Get text from section
-        text = ""
+        parts = []
         for page_num in range(section['start_page'], section['end_page'] + 1):
-            text += self.doc[page_num].get_text()
+            parts.append(self._page_layout(page_num)[2])
+        text = "".join(parts)
 
         # Look for Cases subsection
-        cases_match = re.search(r'Cases\s*\n(.*?)(?:Statutes|Rules|Other|\Z)',
-                               text, re.DOTALL | re.IGNORECASE)
+        cases_match = _RE_CASES_BLOCK.search(text)
         if cases_match:
             text = cases_match.group(1)
 
         normalized = self.normalize_for_eyecite(text)
-        citations = get_citations(normalized)
+        citations = get_citations(normalized, tokenizer=_TOKENIZER)
+
+        if cl_client:
+            self._prefetch_cl(cl_client, [c for c in citations if isinstance(c, FullCaseCitation)])
 
         cases = []
         for cite in citations:
@@ -1196,7 +1486,9 @@ class BriefParser:
                     rep = cite.groups.get('reporter') if hasattr(cite, 'groups') else None
                     page = cite.groups.get('page') if hasattr(cite, 'groups') else None
                     if vol and rep and page:
-                        name = cl_client.get_case_name(vol, rep, page)
+                        record = self._lookup_cl(cl_client, vol, rep, page)
+                        if record:
+                            name = record.get('caseName')
 
                 # Fall back to eyecite
                 if not name:
@@ -1229,6 +1521,16 @@ class BriefParser:
         self.doc.close()
 
 
+def _iter_argument_citations(parsed: Dict) -> Iterator[Dict]:
+    """Yield every citation dict in the argument section, in document order."""
+    for para in parsed.get('argument', {}).get('paragraphs', []):
+        if para['type'] == 'block_quote':
+            yield from para.get('citations', [])
+        else:
+            for sent in para.get('sentences', []):
+                yield from sent.get('citations', [])
+
+
 def propagate_cl_records(parsed: Dict) -> None:
     """
     Propagate CL records from full citations to short and id. citations.
@@ -1240,23 +1542,27 @@ def propagate_cl_records(parsed: Dict) -> None:
       validate pin cite if present. Inherit pin cite from last cite if none.
     """
     # Track full citations by volume/reporter key
-    full_cites_by_key: Dict[str, Dict] = {}  # "vol|reporter" -> citation dict
+    full_cites_by_key: Dict[Tuple[str, str], Dict] = {}  # (vol, reporter) -> citation dict
     last_cite: Optional[Dict] = None  # Most recent citation with CL record
     last_pin_cite: Optional[str] = None  # Most recent pin cite
+    start_page_cache: Dict[int, Optional[int]] = {}  # id(cl_record) -> start page
 
     def get_start_page(cl_record: Dict) -> Optional[int]:
-        """Extract start page from CL record."""
+        """Extract start page from CL record (memoized per record)."""
+        rid = id(cl_record)
+        if rid not in start_page_cache:
+            start_page_cache[rid] = parse_start_page(cl_record)
+        return start_page_cache[rid]
+
+    def parse_start_page(cl_record: Dict) -> Optional[int]:
         citations = cl_record.get('citation', [])
         if isinstance(citations, list):
             for c in citations:
                 if isinstance(c, str):
                     # Parse "184 S.W.3d 242" format
-                    parts = c.split()
-                    if len(parts) >= 3:
-                        try:
-                            return int(parts[-1])
-                        except ValueError:
-                            pass
+                    m = _RE_CL_CITE.match(c)
+                    if m and m.group(3).isdecimal():
+                        return int(m.group(3))
         return None
 
     def is_valid_pin_cite(pin_cite: str, start_page: int) -> bool:
@@ -1265,7 +1571,7 @@ def propagate_cl_records(parsed: Dict) -> None:
             return True  # No pin cite to validate
 
         # Extract page number from pin cite (e.g., "at 685" -> 685)
-        match = re.search(r'(\d+)', pin_cite)
+        match = _RE_FIRST_INT.search(pin_cite)
         if not match:
             return True  # Can't parse, assume valid
 
@@ -1281,90 +1587,78 @@ def propagate_cl_records(parsed: Dict) -> None:
 
         return True
 
-    def process_citations(citations: List[Dict]) -> None:
-        nonlocal last_cite, last_pin_cite
+    # Walk every citation in document order in one flat loop
+    for cite in _iter_argument_citations(parsed):
+        cite_type = cite.get('cite_type')
+        volume = cite.get('volume')
+        reporter = cite.get('reporter')
+        page = cite.get('page')
+        pin_cite = cite.get('pin_cite')
 
-        for cite in citations:
-            cite_type = cite.get('cite_type')
-            volume = cite.get('volume')
-            reporter = cite.get('reporter')
-            page = cite.get('page')
-            pin_cite = cite.get('pin_cite')
+        if cite_type == 'full_case':
+            # Track this full citation
+            if volume and reporter:
+                full_cites_by_key[(volume, sys.intern(reporter))] = cite
 
-            if cite_type == 'full_case':
-                # Track this full citation
-                if volume and reporter:
-                    key = f"{volume}|{reporter}"
-                    full_cites_by_key[key] = cite
+            if cite.get('cl_record'):
+                last_cite = cite
+                last_pin_cite = pin_cite or page
 
-                if cite.get('cl_record'):
-                    last_cite = cite
-                    last_pin_cite = pin_cite or page
+        elif cite_type == 'short_case':
+            # Find matching full citation by volume/reporter
+            if volume and reporter:
+                full_cite = full_cites_by_key.get((volume, sys.intern(reporter)))
 
-            elif cite_type == 'short_case':
-                # Find matching full citation by volume/reporter
-                if volume and reporter:
-                    key = f"{volume}|{reporter}"
-                    full_cite = full_cites_by_key.get(key)
-
-                    if full_cite and full_cite.get('cl_record'):
-                        cl_record = full_cite['cl_record']
-                        start_page = get_start_page(cl_record)
-
-                        # Validate page number
-                        if start_page and page:
-                            try:
-                                if int(page) >= start_page:
-                                    cite['cl_record'] = cl_record
-                                    cite['case_name'] = cite.get('case_name') or full_cite.get('case_name')
-                            except ValueError:
-                                pass
-                        else:
-                            # Can't validate, propagate anyway
-                            cite['cl_record'] = cl_record
-                            cite['case_name'] = cite.get('case_name') or full_cite.get('case_name')
-
-                if cite.get('cl_record'):
-                    last_cite = cite
-                    last_pin_cite = pin_cite or page
-
-            elif cite_type == 'id':
-                # Use most recent citation's CL record
-                if last_cite and last_cite.get('cl_record'):
-                    cl_record = last_cite['cl_record']
+                if full_cite and full_cite.get('cl_record'):
+                    cl_record = full_cite['cl_record']
                     start_page = get_start_page(cl_record)
 
-                    # Get pin cite - use cite's own or inherit from last
-                    effective_pin = pin_cite or last_pin_cite
-
-                    # Validate pin cite if present
-                    if start_page and effective_pin:
-                        if is_valid_pin_cite(effective_pin, start_page):
-                            cite['cl_record'] = cl_record
-                            cite['case_name'] = cite.get('case_name') or last_cite.get('case_name')
-                            # Set pin_cite to effective value (whether own or inherited)
-                            if not pin_cite and effective_pin:
-                                cite['pin_cite'] = effective_pin
+                    # Validate page number
+                    if start_page and page:
+                        try:
+                            if int(page) >= start_page:
+                                cite['cl_record'] = cl_record
+                                cite['case_name'] = cite.get('case_name') or full_cite.get('case_name')
+                        except ValueError:
+                            pass
                     else:
                         # Can't validate, propagate anyway
+                        cite['cl_record'] = cl_record
+                        cite['case_name'] = cite.get('case_name') or full_cite.get('case_name')
+
+            if cite.get('cl_record'):
+                last_cite = cite
+                last_pin_cite = pin_cite or page
+
+        elif cite_type == 'id':
+            # Use most recent citation's CL record
+            if last_cite and last_cite.get('cl_record'):
+                cl_record = last_cite['cl_record']
+                start_page = get_start_page(cl_record)
+
+                # Get pin cite - use cite's own or inherit from last
+                effective_pin = pin_cite or last_pin_cite
+
+                # Validate pin cite if present
+                if start_page and effective_pin:
+                    if is_valid_pin_cite(effective_pin, start_page):
                         cite['cl_record'] = cl_record
                         cite['case_name'] = cite.get('case_name') or last_cite.get('case_name')
+                        # Set pin_cite to effective value (whether own or inherited)
                         if not pin_cite and effective_pin:
                             cite['pin_cite'] = effective_pin
+                else:
+                    # Can't validate, propagate anyway
+                    cite['cl_record'] = cl_record
+                    cite['case_name'] = cite.get('case_name') or last_cite.get('case_name')
+                    if not pin_cite and effective_pin:
+                        cite['pin_cite'] = effective_pin
 
-                    # Update last_pin_cite for next id.
-                    if pin_cite:
-                        last_pin_cite = pin_cite
-                    elif effective_pin:
-                        last_pin_cite = effective_pin
-
-    # Process all paragraphs
-    for para in parsed.get('argument', {}).get('paragraphs', []):
-        if para['type'] == 'block_quote':
-            process_citations(para.get('citations', []))
-        else:
-            for sent in para.get('sentences', []):
-                process_citations(sent.get('citations', []))
+                # Update last_pin_cite for next id.
+                if pin_cite:
+                    last_pin_cite = pin_cite
+                elif effective_pin:
+                    last_pin_cite = effective_pin
 
 
 def add_local_case_paths(parsed: Dict, cl_client: Optional['CourtListenerClient'] = None,
@@ -1393,17 +1687,44 @@ def add_local_case_paths(parsed: Dict, cl_client: Optional['CourtListenerClient'
 
     # Track processed cases to avoid duplicate work (by cluster_id)
     processed_clusters: set = set()
+    start_page_cache: Dict[Tuple[int, str], Optional[str]] = {}  # (id(cl_record), reporter) -> page
+    dir_listings: Dict[str, Set[str]] = {}  # directory -> file names in it
+
+    def file_exists(path: str) -> bool:
+        """Check for a file against a one-time scandir listing of its directory."""
+        directory, name = os.path.split(path)
+        listing = dir_listings.get(directory)
+        if listing is None:
+            try:
+                with os.scandir(directory) as entries:
+                    listing = {entry.name for entry in entries}
+            except OSError:
+                listing = set()
+            dir_listings[directory] = listing
+        return name in listing
+
+    def mark_exists(path: str) -> None:
+        """Record a file written after its directory was listed."""
+        directory, name = os.path.split(path)
+        if directory in dir_listings:
+            dir_listings[directory].add(name)
 
     def get_start_page_from_cl(cl_record: Dict, reporter: str) -> Optional[str]:
-        """Extract start page from CL record for the matching reporter."""
+        """Extract start page from CL record for the matching reporter (memoized)."""
+        key = (id(cl_record), reporter)
+        if key not in start_page_cache:
+            start_page_cache[key] = parse_start_page_from_cl(cl_record, reporter)
+        return start_page_cache[key]
+
+    def parse_start_page_from_cl(cl_record: Dict, reporter: str) -> Optional[str]:
         citations = cl_record.get('citation', [])
         if isinstance(citations, list):
             for c in citations:
                 if isinstance(c, str) and reporter in c:
                     # Parse "265 S.W.3d 580" format
-                    parts = c.split()
-                    if len(parts) >= 3:
-                        return parts[-1]  # Last part is page
+                    m = _RE_CL_CITE.match(c)
+                    if m:
+                        return m.group(3)  # Last part is page
         return None
 
     def process_citation(cite: Dict) -> None:
@@ -1425,12 +1746,10 @@ def add_local_case_paths(parsed: Dict, cl_client: Optional['CourtListenerClient'
             # Extract from CL citation list
             citations = cl_record.get('citation', [])
             for c in citations:
-                if isinstance(c, str):
-                    parts = c.split()
-                    if len(parts) >= 3:
-                        volume = parts[0]
-                        reporter = ' '.join(parts[1:-1])
-                        break
+                m = _RE_CL_CITE.match(c) if isinstance(c, str) else None
+                if m:
+                    volume, reporter = m.group(1), m.group(2)
+                    break
 
         if not volume or not reporter:
             stats['no_cl_record'] += 1
@@ -1460,15 +1779,15 @@ def add_local_case_paths(parsed: Dict, cl_client: Optional['CourtListenerClient'
         # Skip if already processed this cluster
         if cluster_id and cluster_id in processed_clusters:
             # Still count as exists if files are there
-            if os.path.exists(json_path):
+            if file_exists(json_path):
                 stats['local_exists'] += 1
             return
         if cluster_id:
             processed_clusters.add(cluster_id)
 
         # Check if files exist
-        json_exists = os.path.exists(json_path)
-        html_exists = os.path.exists(html_path)
+        json_exists = file_exists(json_path)
+        html_exists = file_exists(html_path)
 
         if json_exists and html_exists:
             stats['local_exists'] += 1
@@ -1477,26 +1796,34 @@ def add_local_case_paths(parsed: Dict, cl_client: Optional['CourtListenerClient'
         # Try to download if missing
         if download_missing and cl_client:
             json_saved, html_saved = cl_client.download_case(volume, reporter, start_page)
+            if json_saved:
+                mark_exists(json_path)
+            if html_saved:
+                mark_exists(html_path)
             if json_saved or html_saved:
                 stats['downloaded'] += 1
                 return
 
         stats['not_available'] += 1
 
+    # Propositions hold the same citation dicts as the argument paragraphs,
+    # so each dict is processed (and counted) only once
+    seen: Set[int] = set()
+
+    def process_once(cite: Dict) -> None:
+        if id(cite) in seen:
+            return
+        seen.add(id(cite))
+        process_citation(cite)
+
     # Process all citations in argument paragraphs
-    for para in parsed.get('argument', {}).get('paragraphs', []):
-        if para['type'] == 'block_quote':
-            for cite in para.get('citations', []):
-                process_citation(cite)
-        else:
-            for sent in para.get('sentences', []):
-                for cite in sent.get('citations', []):
-                    process_citation(cite)
+    for cite in _iter_argument_citations(parsed):
+        process_once(cite)
 
-    # Also process propositions (which contain copies of citations)
+    # Also process propositions (covers any citation not shared with the argument)
     for prop in parsed.get('propositions', []):
         for cite in prop.get('citations', []):
-            process_citation(cite)
+            process_once(cite)
 
     return stats
 
@@ -1580,11 +1907,16 @@ def _extract_proposition_from_sentence(
     if not citations:
         return None, ''
 
-    # Find where the first citation starts and last citation ends
-    first_cite = min(citations, key=lambda c: c['span'][0])
-    last_cite = max(citations, key=lambda c: c['span'][1])
-    cite_start = first_cite['span'][0]
-    cite_end = last_cite['span'][1]
+    # Find where the first citation starts and last citation ends (one pass)
+    first_cite = citations[0]
+    cite_start, cite_end = first_cite['span']
+    for c in citations[1:]:
+        start, end = c['span']
+        if start < cite_start:
+            first_cite = c
+            cite_start = start
+        if end > cite_end:
+            cite_end = end
 
     # Get text before the first citation
     text_before = sent_text[:cite_start].strip()
@@ -1605,11 +1937,13 @@ def _extract_proposition_from_sentence(
 
     # Remove signal from text_before if present
     signal = first_cite.get('signal')
-    if signal and text_before.lower().endswith(signal.lower()):
-        text_before = text_before[:-len(signal)].strip()
+    if signal:
+        signal_lower = _SIGNAL_LOWER.get(signal) or signal.lower()
+        if text_before[-len(signal_lower):].lower() == signal_lower:
+            text_before = text_before[:-len(signal)].strip()
 
     # Clean up trailing punctuation and dashes
-    text_before = text_before.rstrip('.,;:-– ')
+    text_before = text_before.rstrip(_TRAIL_PUNCT_DASH)
 
     # Is there meaningful text before the citation?
     # "Meaningful" = more than just a signal or short connector
@@ -1635,9 +1969,16 @@ def _extract_proposition_from_sentence(
 
 def _has_quotation(text: str) -> bool:
     """Check if text contains a substantial quotation."""
+    # Most sentences have no opening quote at all; skip the regex for them
+    if '"' not in text and '\u201c' not in text:
+        return False
     # Look for quoted text of 15+ characters
-    quote_pattern = r'["\u201c][^"\u201d]{15,}["\u201d]'
-    return bool(re.search(quote_pattern, text))
+    return bool(_RE_QUOTE.search(text))
+
+
+def _preview(s: str, n: int) -> str:
+    """First n characters of s, with '...' if truncated."""
+    return s if len(s) <= n else s[:n] + "..."
 
 
 def main():
@@ -1720,7 +2061,7 @@ def main():
         # Show sample propositions
         print("\nSample propositions:")
         for i, prop in enumerate(propositions[:5], 1):
-            text = prop['text'][:100] + "..." if len(prop['text']) > 100 else prop['text']
+            text = _preview(prop['text'], 100)
             cite_names = [c.get('case_name') or c.get('text', '')[:25] for c in prop['citations'][:2]]
             print(f"  {i}. [{prop['type']}] {text}")
             print(f"     -> {cite_names}")
@@ -1738,7 +2079,7 @@ def main():
         # Save JSON
         output_file = pdf_path.replace('.pdf', '_parsed.json').replace('.PDF', '_parsed.json')
         with open(output_file, 'w') as f:
-            json.dump(parsed, f, indent=2, ensure_ascii=False)
+            _dump_json(parsed, f)
         print(f"\nOutput: {output_file}")
 
     finally:
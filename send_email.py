@@ -11,7 +11,9 @@ import sys
 import smtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from html.parser import HTMLParser
 from pathlib import Path
+from typing import Optional
 
 from dotenv import load_dotenv
 
@@ -19,24 +21,59 @@ from dotenv import load_dotenv
 load_dotenv(Path(__file__).parent / '.env')
 
 
-def send_email(html_file: str, recipient: str, subject: str = None) -> bool:
-    """Send an HTML file as an email."""
-    # Get SMTP settings from environment
-    smtp_host = os.environ.get('SMTP_HOST', 'smtp.fastmail.com')
-    smtp_port = int(os.environ.get('SMTP_PORT', 587))
-    smtp_user = os.environ.get('SMTP_USER')
-    smtp_password = os.environ.get('SMTP_PASSWORD')
-    from_email = os.environ.get('FROM_EMAIL', smtp_user)
-
-    if not smtp_user or not smtp_password:
-        print("Error: SMTP_USER and SMTP_PASSWORD must be set in .env")
-        return False
+class _PlainTextExtractor(HTMLParser):
+    """Collect visible text from HTML, skipping <style>/<script> contents."""
+
+    def __init__(self):
+        super().__init__()
+        self.pieces = []
+        self._skip = 0
+
+    def text(self) -> str:
+        """Text collected so far, whitespace-normalized."""
+        return ' '.join(''.join(self.pieces).split())
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ('style', 'script'):
+            self._skip += 1
+        self.pieces.append(' ')
+
+    def handle_endtag(self, tag):
+        if tag in ('style', 'script') and self._skip:
+            self._skip -= 1
+        self.pieces.append(' ')
+
+    def handle_data(self, data):
+        # Keep raw pieces: a word cut at a feed() boundary arrives in two calls
+        if not self._skip:
+            self.pieces.append(data)
+
+
+def html_to_plain_text(html_content: str, limit: int = 500) -> str:
+    """
+    First `limit` characters of the visible text in an HTML document.
+
+    Feeds the parser in chunks and stops once enough text is collected, so
+    the cost doesn't grow with the size of the report.
+    """
+    parser = _PlainTextExtractor()
+    for i in range(0, len(html_content), 4096):
+        parser.feed(html_content[i:i + 4096])
+        text = parser.text()
+        if len(text) > limit:
+            return text[:limit]
+    parser.close()
+    return parser.text()[:limit]
+
 
+def build_message(html_file: str, recipient: str, from_email: str,
+                  subject: str = None) -> Optional[MIMEMultipart]:
+    """Build the HTML + plain text message for a report, or None if the file is missing."""
     # Read the HTML file
     html_path = Path(html_file)
     if not html_path.exists():
         print(f"Error: File not found: {html_file}")
-        return False
+        return None
 
     html_content = html_path.read_text()
 
@@ -50,23 +87,99 @@ def send_email(html_file: str, recipient: str, subject: str = None) -> bool:
     msg['From'] = from_email
     msg['To'] = recipient
 
-    # Create plain text version (simple extraction)
-    import re
-    plain_text = re.sub(r'<[^>]+>', ' ', html_content)
-    plain_text = ' '.join(plain_text.split())[:500] + "...\n\n[See HTML version for full report]"
+    # Create plain text version (opening text of the report)
+    plain_text = html_to_plain_text(html_content) + "...\n\n[See HTML version for full report]"
 
     # Attach both versions
     msg.attach(MIMEText(plain_text, 'plain'))
     msg.attach(MIMEText(html_content, 'html'))
 
+    return msg
+
+
+class SMTPSender:
+    """
+    One logged-in SMTP connection reused for several sends.
+
+    Usage:
+        with SMTPSender() as sender:
+            for recipient in recipients:
+                sender.send(html_file, recipient)
+
+    Uses STARTTLS on the default port 587; setting SMTP_PORT=465 switches
+    to implicit TLS (SMTP_SSL).
+    """
+
+    def __init__(self):
+        # Get SMTP settings from environment
+        self.host = os.environ.get('SMTP_HOST', 'smtp.fastmail.com')
+        self.port = int(os.environ.get('SMTP_PORT', 587))
+        self.user = os.environ.get('SMTP_USER')
+        self.password = os.environ.get('SMTP_PASSWORD')
+        self.from_email = os.environ.get('FROM_EMAIL', self.user)
+        self.server = None
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.user and self.password)
+
+    def __enter__(self) -> 'SMTPSender':
+        if not self.configured:
+            raise ValueError("SMTP_USER and SMTP_PASSWORD must be set in .env")
+        if self.port == 465:
+            self.server = smtplib.SMTP_SSL(self.host, self.port)
+        else:
+            self.server = smtplib.SMTP(self.host, self.port)
+        try:
+            if self.port != 465:
+                self.server.starttls()
+            self.server.login(self.user, self.password)
+        except Exception:
+            self.server.close()
+            self.server = None
+            raise
+        return self
+
+    def __exit__(self, *exc) -> None:
+        try:
+            self.server.quit()
+        except smtplib.SMTPException:
+            pass
+        self.server = None
+
+    def send(self, html_file: str, recipient: str, subject: str = None) -> bool:
+        """Send an HTML file as an email over the open connection."""
+        msg = build_message(html_file, recipient, self.from_email, subject)
+        if msg is None:
+            return False
+        return self.send_message(msg)
+
+    def send_message(self, msg: MIMEMultipart) -> bool:
+        try:
+            self.server.send_message(msg)
+        except smtplib.SMTPException as e:
+            print(f"Error sending email: {e}")
+            return False
+        print(f"Email sent to {msg['To']}")
+        return True
+
+
+def send_email(html_file: str, recipient: str, subject: str = None) -> bool:
+    """Send an HTML file as an email."""
+    sender = SMTPSender()
+    if not sender.configured:
+        print("Error: SMTP_USER and SMTP_PASSWORD must be set in .env")
+        return False
+
+    # Build first so a missing file doesn't cost a connection
+    msg = build_message(html_file, recipient, sender.from_email, subject)
+    if msg is None:
+        return False
+
     # Send the email
     try:
-        with smtplib.SMTP(smtp_host, smtp_port) as server:
-            server.starttls()
-            server.login(smtp_user, smtp_password)
-            server.send_message(msg)
-        print(f"Email sent to {recipient}")
-        return True
+        with sender:
+            return sender.send_message(msg)
     except Exception as e:
         print(f"Error sending email: {e}")
         return False
@@ -0,0 +1,53 @@
+"""Regression checks for batched citation extraction in parse_brief."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from parse_brief import BriefParser
+
+
+# _citations_by_unit and _get_case_name only need eyecite, not an open PDF
+parser = BriefParser.__new__(BriefParser)
+
+
+def _spans(found):
+    return [(type(cite).__name__, start, end, cite.metadata.pin_cite,
+             parser._get_case_name(cite))
+            for start, end, cite in found]
+
+
+def _check_matches_per_unit(texts):
+    batched = parser._citations_by_unit(texts)
+    for text, found in zip(texts, batched):
+        assert _spans(found) == _spans(parser._find_citations(text)), text
+
+
+def test_consecutive_id_sentences():
+    _check_matches_per_unit(["Id.", "Id. at 461."])
+
+
+def test_full_span_stays_in_its_sentence():
+    _check_matches_per_unit([
+        "See Smith v. Jones, 123 S.W.3d 456, 460 (Tex. 2004) (holding that the rule applies).",
+        "The court agreed. Jones v. State, 1 S.W.3d 2 (Tex. 1999).",
+    ])
+
+
+def test_id_does_not_take_next_sentence_pin():
+    _check_matches_per_unit(["Id.", "at 5."])
+
+
+def test_case_name_not_taken_from_previous_sentence():
+    _check_matches_per_unit([
+        "This is what the court said in Smith v. Jones",
+        "123 S.W.3d 456 (Tex. 2004).",
+    ])
+
+
+def test_full_span_does_not_start_in_previous_sentence():
+    _check_matches_per_unit([
+        "The trial court held that Smith",
+        "v. Jones, 123 S.W.3d 456 (Tex. 2004).",
+    ])
@@ -14,8 +14,12 @@ import re
 import json
 import sys
 import os
+import functools
+from collections import Counter
+import mmap
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Set
 from dataclasses import dataclass
 from enum import Enum
 import html
@@ -28,6 +32,66 @@ load_dotenv(Path(__file__).parent / '.env')
 # subprocess is used for calling claude CLI
 import subprocess
 
+# Concurrent claude CLI calls; each one mostly waits on the model
+CLAUDE_MAX_WORKERS = 8
+
+# orjson parses large case JSON several times faster than the stdlib and takes
+# bytes directly; its JSONDecodeError subclasses json.JSONDecodeError.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# ijson streams just the propositions array out of a large parsed brief
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# selectolax's lexbor backend strips tags and decodes entities in one C pass
+try:
+    from selectolax.lexbor import LexborHTMLParser as _HTMLParser
+except ImportError:
+    _HTMLParser = None
+
+# pyahocorasick finds every quote cited to a case in one scan of its text
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Precompiled regex patterns
+_DOUBLE_QUOTE = re.compile(r'"([^"]+)"')  # Standard double quotes
+_ANY_DOUBLE_QUOTE = re.compile('"([^"]+)"|\u201c([^\u201d]+)\u201d')  # Standard or curly
+_SINGLE_QUOTE = re.compile(r"'([^']+)'")  # Single quotes (for nested)
+_ELLIPSIS = re.compile(r'\s*\.{3,}\s*')
+_BRACKETS = re.compile(r'\[[^\]]*\]')
+_TAGS = re.compile(r'<[^>]+>')
+_NONWORD = re.compile(r'[^\w\s]')
+_PAGE_DIGIT = re.compile(r'(\d+)')
+
+# Curly quotes and dashes folded to ASCII for matching
+_FOLD = str.maketrans({
+    '\u201c': '"', '\u201d': '"',
+    '\u2018': "'", '\u2019': "'",
+    '\u2014': '-', '\u2013': '-',
+})
+
+# The entities CourtListener HTML actually uses; '&amp;' goes last (see _unescape)
+_ENTITY_FIXES = (('&nbsp;', ' '), ('&lt;', '<'), ('&gt;', '>'),
+                 ('&quot;', '"'), ('&#39;', "'"))
+
+
+# Page marker: id="p595", optionally with the rest of the anchor (...>*595</a>)
+_PAGE_MARKER = re.compile(rb'id="p(\d+)"([^>]*>.*?</a>)?')
+
+
+@functools.lru_cache(maxsize=256)
+def _star_pattern(page_num: str) -> re.Pattern:
+    """Fallback marker for a page without an id anchor: *595</a>"""
+    return re.compile(rb'\*' + page_num.encode() + rb'</a>')
+
 
 class ValidationResult(Enum):
     VERIFIED = "verified"      # Green check - found/supported
@@ -47,18 +111,40 @@ class PropositionValidation:
     page_checked: Optional[str] = None  # The page number checked
 
 
+def _unescape(text: str) -> str:
+    """
+    html.unescape with a str.replace fast path for the common entities.
+
+    None of the replacements produce '&', so if every '&' left belongs to
+    an '&amp;' the text is done; otherwise html.unescape handles the rest.
+    """
+    if '&' not in text:
+        return text
+    for entity, char in _ENTITY_FIXES:
+        text = text.replace(entity, char)
+    if text.count('&') == text.count('&amp;'):
+        return text.replace('&amp;', '&')
+    return html.unescape(text)
+
+
+def _html_to_text(content: str) -> str:
+    """Strip tags, decode entities and normalize whitespace in an HTML string."""
+    if _HTMLParser is not None:
+        text = _HTMLParser(content).text(separator=' ')
+    else:
+        text = _unescape(_TAGS.sub(' ', content))
+    return ' '.join(text.split())
+
+
 def extract_quotes(text: str) -> List[str]:
     """Extract quoted text from a proposition."""
-    # Match text in various quote styles
-    patterns = [
-        r'"([^"]+)"',           # Standard double quotes
-        r'"([^"]+)"',           # Curly double quotes
-        r"'([^']+)'",           # Single quotes (for nested)
-    ]
+    # Straight and curly double quotes in one scan; ASCII text can't have curly ones
+    if text.isascii():
+        quotes = _DOUBLE_QUOTE.findall(text)
+    else:
+        quotes = [straight or curly for straight, curly in _ANY_DOUBLE_QUOTE.findall(text)]
 
-    quotes = []
-    for pattern in patterns:
-        quotes.extend(re.findall(pattern, text))
+    quotes.extend(_SINGLE_QUOTE.findall(text))
 
     return quotes
 
@@ -97,96 +183,101 @@ def normalize_for_matching(text: str) -> str:
     if not text:
         return ""
 
-    # Normalize whitespace
-    text = ' '.join(text.split())
-
-    # Normalize quotes
-    text = text.replace('"', '"').replace('"', '"')
-    text = text.replace(''', "'").replace(''', "'")
+    # Normalize quotes and dashes
+    text = text.translate(_FOLD)
 
     # Normalize ellipses
-    text = re.sub(r'\.{3,}', '...', text)
-    text = re.sub(r'\s*\.\.\.\s*', ' ... ', text)
+    text = _ELLIPSIS.sub(' ... ', text)
 
     # Remove bracketed insertions for matching
-    text = re.sub(r'\[[^\]]*\]', '', text)
+    text = _BRACKETS.sub('', text)
 
-    # Normalize dashes
-    text = text.replace('—', '-').replace('–', '-')
-
-    # Remove extra spaces
+    # Normalize whitespace
     text = ' '.join(text.split())
 
     return text.lower()
 
 
+@functools.lru_cache(maxsize=256)
 def extract_page_text(html_path: str, page_num: str) -> Optional[str]:
     """
     Extract text from a specific page in the HTML case file.
 
     HTML files have page markers like: <a id="p595" ... >*595</a>
+
+    The file is memory-mapped and searched as bytes; only the page's slice
+    is decoded.
     """
     if not os.path.exists(html_path):
         return None
 
     try:
-        with open(html_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except (IOError, UnicodeDecodeError):
+        index = _page_index(html_path)
+        with open(html_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            page_html = _page_slice(content, index, page_num)
+    except (IOError, ValueError):  # ValueError: empty file can't be mapped
         return None
 
-    # Find the page marker
-    page_pattern = rf'id="p{page_num}"[^>]*>.*?</a>'
-    page_match = re.search(page_pattern, content)
-
-    if not page_match:
-        # Try without the exact format
-        page_pattern = rf'\*{page_num}</a>'
-        page_match = re.search(page_pattern, content)
-
-    if not page_match:
+    if page_html is None:
         return None
 
-    start_pos = page_match.end()
-
-    # Find the next page marker
-    next_page = int(page_num) + 1
-    next_pattern = rf'id="p{next_page}"'
-    next_match = re.search(next_pattern, content[start_pos:])
+    # Extract and clean the HTML
+    return _html_to_text(page_html.decode('utf-8', errors='ignore'))
 
-    if next_match:
-        end_pos = start_pos + next_match.start()
-    else:
-        # Take next 5000 chars if no next page found
-        end_pos = start_pos + 5000
 
-    # Extract and clean the HTML
-    page_html = content[start_pos:end_pos]
+@functools.lru_cache(maxsize=128)
+def _page_index(html_path: str) -> Dict[str, List[Tuple[int, int]]]:
+    """
+    Offsets of every page marker in an HTML case file, built in one scan.
 
-    # Remove HTML tags
-    page_text = re.sub(r'<[^>]+>', ' ', page_html)
+    Maps page number to a list of (marker_start, text_start) in file order;
+    text_start is -1 when the marker isn't a full <a ...>*595</a> anchor.
+    """
+    index: Dict[str, List[Tuple[int, int]]] = {}
+    with open(html_path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+        for m in _PAGE_MARKER.finditer(content):
+            text_start = m.end() if m.group(2) else -1
+            index.setdefault(m.group(1).decode(), []).append((m.start(), text_start))
+    return index
+
+
+def _page_slice(content: mmap.mmap, index: Dict[str, List[Tuple[int, int]]],
+                page_num: str) -> Optional[bytes]:
+    """Raw HTML between the page's marker and the next page's marker."""
+    # Find the page marker
+    start_pos = next((t for _, t in index.get(page_num, ()) if t >= 0), None)
 
-    # Decode HTML entities
-    page_text = html.unescape(page_text)
+    if start_pos is None:
+        # Try without the exact format
+        page_match = _star_pattern(page_num).search(content)
+        if not page_match:
+            return None
+        start_pos = page_match.end()
 
-    # Normalize whitespace
-    page_text = ' '.join(page_text.split())
+    # Find the next page marker, or take next 5000 bytes if none
+    next_page = str(int(page_num) + 1)
+    end_pos = next((m for m, _ in index.get(next_page, ()) if m >= start_pos),
+                   start_pos + 5000)
 
-    return page_text
+    return content[start_pos:end_pos]
 
 
+@functools.lru_cache(maxsize=128)
 def extract_case_text(json_path: str, html_path: Optional[str] = None) -> Optional[str]:
     """
     Extract full opinion text from the case files.
 
-    Tries JSON first, falls back to HTML if JSON text is empty.
+    Tries JSON first, falls back to HTML if JSON text is empty. Cached, since
+    a brief usually cites the same case many times.
     """
     text_from_json = None
 
     if json_path and os.path.exists(json_path):
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(json_path, 'rb') as f:
+                data = _json_loads(f.read())
 
             # Get opinions from casebody
             opinions = data.get('casebody', {}).get('opinions', [])
@@ -214,59 +305,151 @@ def extract_case_text(json_path: str, html_path: Optional[str] = None) -> Option
             with open(html_path, 'r', encoding='utf-8') as f:
                 content = f.read()
 
-            # Strip HTML tags
-            text = re.sub(r'<[^>]+>', ' ', content)
-            text = html.unescape(text)
-            text = ' '.join(text.split())
-            return text
+            return _html_to_text(content)
         except (IOError, UnicodeDecodeError):
             pass
 
     return None
 
 
+@functools.lru_cache(maxsize=128)
+def _normalized(text: str) -> Tuple[str, str]:
+    """
+    Return (normalized, punctuation-stripped) forms of page or case text.
+
+    Keyed on the text itself: extract_case_text/extract_page_text hand back
+    the same cached string object, whose hash Python also caches, so repeat
+    lookups for the same case are cheap.
+    """
+    norm = normalize_for_matching(text)
+    return norm, _NONWORD.sub('', norm)
+
+
 def find_quote_in_case(quote: str, case_text: str, page_text: Optional[str] = None) -> Tuple[bool, Optional[str]]:
     """
     Search for a quote in the case text.
 
     Returns (found, matched_text)
     """
-    norm_quote = normalize_for_matching(quote)
-
-    # First try the specific page if available
-    if page_text:
-        norm_page = normalize_for_matching(page_text)
-        if norm_quote in norm_page:
-            return True, quote
-
-        # Try with more aggressive normalization (remove all punctuation)
-        super_norm_quote = re.sub(r'[^\w\s]', '', norm_quote)
-        super_norm_page = re.sub(r'[^\w\s]', '', norm_page)
-        if super_norm_quote in super_norm_page:
-            return True, quote
-
-    # Try the full case text
-    if case_text:
-        norm_case = normalize_for_matching(case_text)
-        if norm_quote in norm_case:
-            return True, quote
-
-        # Try with more aggressive normalization
-        super_norm_quote = re.sub(r'[^\w\s]', '', norm_quote)
-        super_norm_case = re.sub(r'[^\w\s]', '', norm_case)
-        if super_norm_quote in super_norm_case:
-            return True, quote
-
+    if find_quotes_in_case([quote], case_text, page_text)[quote]:
+        return True, quote
     return False, None
 
 
+def find_quotes_in_case(quotes: List[str], case_text: Optional[str],
+                        page_text: Optional[str] = None,
+                        case_hits: Optional[Set[str]] = None) -> Dict[str, bool]:
+    """
+    Search for several quotes at once: the pin-cited page first, then the full case.
+
+    Each text is normalized once (and cached), not once per quote. case_hits,
+    when given, are the quotes already known to be in the case text (from
+    prematch_quotes), so the case itself isn't searched again.
+
+    Returns dict quote -> found
+    """
+    hits = _quote_hits(quotes, page_text) if page_text else set()
+    rest = [q for q in quotes if q not in hits]
+    if rest:
+        if case_hits is not None:
+            hits.update(q for q in rest if q in case_hits)
+        elif case_text:
+            hits |= _quote_hits(rest, case_text)
+    return {q: q in hits for q in quotes}
+
+
+def _find_all(needles: Set[str], haystack: str) -> Set[str]:
+    """Return the needles that occur in haystack."""
+    if ahocorasick is None or len(needles) < 2:
+        return {n for n in needles if n in haystack}
+
+    found = {n for n in needles if not n}  # '' is in every string
+    automaton = ahocorasick.Automaton()
+    for n in needles:
+        if n:
+            automaton.add_word(n, n)
+    automaton.make_automaton()
+    found.update(n for _, n in automaton.iter(haystack))
+    return found
+
+
+def _quote_hits(quotes: List[str], text: str) -> Set[str]:
+    """
+    Return the quotes found in text.
+
+    Same matching as find_quote_in_case (normalized, then punctuation-stripped),
+    but all quotes are matched in a single scan per normalization.
+    """
+    norm_text, super_norm_text = _normalized(text)
+
+    norm = {q: normalize_for_matching(q) for q in quotes}
+    hits = _find_all(set(norm.values()), norm_text)
+    found = {q for q, n in norm.items() if n in hits}
+
+    rest = {q: _NONWORD.sub('', n) for q, n in norm.items() if q not in found}
+    if rest:
+        hits = _find_all(set(rest.values()), super_norm_text)
+        found.update(q for q, n in rest.items() if n in hits)
+
+    return found
+
+
+def _local_cite(citations: List[Dict]) -> Optional[Dict]:
+    """Return the first citation with local case files."""
+    for c in citations:
+        if c.get('local_json_path'):
+            return c
+    return None
+
+
+def _quotes_to_check(prop_text: str) -> List[str]:
+    """Quotes of a quote proposition worth searching for (20+ chars)."""
+    quotes = extract_quotes(prop_text)
+    if not quotes:
+        # The whole text might be the quote (block quote)
+        quotes = [prop_text]
+    return [q for q in quotes if len(q) >= 20]  # Skip very short quotes
+
+
+def _match_case(case_text: Optional[str], quotes: List[str]) -> Set[str]:
+    """Quotes found in one case's text (runs in a worker process)."""
+    return _quote_hits(quotes, case_text) if case_text else set()
+
+
+def prematch_quotes(propositions: List[Dict]) -> Dict[Tuple[str, Optional[str]], Set[str]]:
+    """
+    Search all quotes cited to the same case in one pass over that case's text.
+
+    Case text is extracted here, in the parent, so extract_case_text's cache
+    is warm for validate_proposition; the independent, CPU-bound matching
+    (normalize, scan) is spread over a process pool.
+
+    Returns:
+        Dict mapping (json_path, html_path) to the set of quotes found in it
+    """
+    by_case: Dict[Tuple[str, Optional[str]], Set[str]] = {}
+    for prop in propositions:
+        cite = _local_cite(prop.get('citations', []))
+        if cite and is_quote_proposition(prop):
+            key = (cite.get('local_json_path'), cite.get('local_html_path'))
+            by_case.setdefault(key, set()).update(_quotes_to_check(prop.get('text', '')))
+
+    keys = list(by_case)
+    texts = [extract_case_text(*key) for key in keys]
+    quotes = [list(by_case[key]) for key in keys]
+    if len(keys) < 2:
+        return dict(zip(keys, map(_match_case, texts, quotes)))
+
+    workers = min(len(keys), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(keys, executor.map(_match_case, texts, quotes)))
+
+
 def verify_semantic(proposition: str, case_text: str, case_name: str,
                    pin_cite: Optional[str] = None) -> Tuple[ValidationResult, str]:
     """
     Use Claude Code CLI to verify if the proposition is supported by the case text.
     """
-    import tempfile
-
     # Truncate case text if too long
     max_case_len = 15000
     if len(case_text) > max_case_len:
@@ -295,21 +478,16 @@ UNCERTAIN - Cannot determine from available text
 Then provide a brief (1-2 sentence) explanation."""
 
     try:
-        # Write prompt to temp file to avoid shell escaping issues
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write(prompt)
-            prompt_file = f.name
-
-        # Call claude CLI with --print flag for non-interactive output
+        # Call claude CLI with --print flag for non-interactive output;
+        # the prompt goes on stdin so long case text can't hit argv limits
         result = subprocess.run(
-            ['claude', '--print', '-p', prompt],
+            ['claude', '--print'],
+            input=prompt,
             capture_output=True,
             text=True,
             timeout=60
         )
 
-        os.unlink(prompt_file)
-
         if result.returncode != 0:
             return ValidationResult.UNCERTAIN, f"CLI error: {result.stderr[:100]}"
 
@@ -331,8 +509,16 @@ Then provide a brief (1-2 sentence) explanation."""
         return ValidationResult.UNCERTAIN, f"Error: {str(e)}"
 
 
-def validate_proposition(prop: Dict) -> PropositionValidation:
-    """Validate a single proposition against its cited cases."""
+def validate_proposition(prop: Dict,
+                         case_hits: Optional[Set[str]] = None) -> PropositionValidation:
+    """
+    Validate a single proposition against its cited cases.
+
+    Args:
+        prop: Proposition dict from the parsed brief
+        case_hits: Quotes already known to be in the cited case (from
+            prematch_quotes); searched here when not given
+    """
 
     prop_text = prop.get('text', '')
     prop_type = 'quote' if is_quote_proposition(prop) else 'statement'
@@ -348,11 +534,7 @@ def validate_proposition(prop: Dict) -> PropositionValidation:
         )
 
     # Use the first citation with local paths
-    cite = None
-    for c in citations:
-        if c.get('local_json_path'):
-            cite = c
-            break
+    cite = _local_cite(citations)
 
     if not cite:
         return PropositionValidation(
@@ -384,7 +566,7 @@ def validate_proposition(prop: Dict) -> PropositionValidation:
     page_num = None
     if pin_cite and html_path:
         # Extract page number from pin cite
-        page_match = re.search(r'(\d+)', str(pin_cite))
+        page_match = _PAGE_DIGIT.search(str(pin_cite))
         if page_match:
             page_num = page_match.group(1)
             page_text = extract_page_text(html_path, page_num)
@@ -392,23 +574,18 @@ def validate_proposition(prop: Dict) -> PropositionValidation:
     # Validate based on type
     if prop_type == 'quote':
         # For quotes, search for the text
-        quotes = extract_quotes(prop_text)
-        if not quotes:
-            # The whole text might be the quote (block quote)
-            quotes = [prop_text]
+        quotes = _quotes_to_check(prop_text)
 
+        found = find_quotes_in_case(quotes, case_text, page_text, case_hits)
         for quote in quotes:
-            if len(quote) < 20:  # Skip very short quotes
-                continue
-            found, matched = find_quote_in_case(quote, case_text, page_text)
-            if found:
+            if found[quote]:
                 return PropositionValidation(
                     proposition_text=prop_text,
                     proposition_type=prop_type,
                     citations=citations,
                     result=ValidationResult.VERIFIED,
                     explanation=f"Quote found in {case_name}",
-                    matched_text=matched,
+                    matched_text=quote,
                     page_checked=page_num
                 )
 
@@ -444,15 +621,19 @@ def generate_html_report(validations: List[PropositionValidation],
     """Generate an HTML report of validation results."""
 
     # Count results
-    verified = sum(1 for v in validations if v.result == ValidationResult.VERIFIED)
-    failed = sum(1 for v in validations if v.result == ValidationResult.FAILED)
-    uncertain = sum(1 for v in validations if v.result == ValidationResult.UNCERTAIN)
+    counts = Counter(v.result for v in validations)
+    verified = counts[ValidationResult.VERIFIED]
+    failed = counts[ValidationResult.FAILED]
+    uncertain = counts[ValidationResult.UNCERTAIN]
+
+    esc = html.escape
+    brief_name = esc(brief_name)
 
-    html_content = f'''<!DOCTYPE html>
+    parts = [f'''<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
-    <title>Citation Validation: {html.escape(brief_name)}</title>
+    <title>Citation Validation: {brief_name}</title>
     <style>
         body {{
             font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
@@ -537,7 +718,7 @@ def generate_html_report(validations: List[PropositionValidation],
 </head>
 <body>
     <h1>Citation Validation Report</h1>
-    <p><strong>Brief:</strong> {html.escape(brief_name)}</p>
+    <p><strong>Brief:</strong> {brief_name}</p>
 
     <div class="summary">
         <span class="verified">✓ Verified: {verified}</span>
@@ -545,7 +726,7 @@ def generate_html_report(validations: List[PropositionValidation],
         <span class="uncertain">? Uncertain: {uncertain}</span>
         <span>Total: {len(validations)}</span>
     </div>
-'''
+''']
 
     for i, v in enumerate(validations, 1):
         result_class = v.result.value
@@ -557,34 +738,48 @@ def generate_html_report(validations: List[PropositionValidation],
             icon = '?'
 
         # Format citations
-        cite_html = ''
+        cite_parts = []
         for c in v.citations[:3]:  # Show first 3 citations
             name = c.get('case_name') or 'Unknown'
             pin = c.get('pin_cite') or ''
             if pin:
-                cite_html += f'<span class="citation">{html.escape(str(name))} at {html.escape(str(pin))}</span>'
+                cite_parts.append(f'<span class="citation">{esc(str(name))} at {esc(str(pin))}</span>')
             else:
-                cite_html += f'<span class="citation">{html.escape(str(name))}</span>'
+                cite_parts.append(f'<span class="citation">{esc(str(name))}</span>')
+        cite_html = ''.join(cite_parts)
 
         page_info = f' (checked page {v.page_checked})' if v.page_checked else ''
 
-        html_content += f'''
+        parts.append(f'''
     <div class="proposition {result_class}">
         <span class="icon {result_class}">{icon}</span>
-        <div class="prop-type">{html.escape(v.proposition_type)}</div>
-        <div class="prop-text">{html.escape(v.proposition_text)}</div>
+        <div class="prop-type">{esc(v.proposition_type)}</div>
+        <div class="prop-text">{esc(v.proposition_text)}</div>
         <div class="citations">{cite_html}</div>
-        <div class="explanation">{html.escape(v.explanation)}<span class="page-info">{page_info}</span></div>
+        <div class="explanation">{esc(v.explanation)}<span class="page-info">{page_info}</span></div>
     </div>
-'''
+''')
 
-    html_content += '''
+    parts.append('''
 </body>
 </html>
-'''
+''')
 
     with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+        f.write(''.join(parts))
+
+
+def load_propositions(parsed_json_path: str) -> List[Dict]:
+    """
+    Load the propositions array from a _parsed.json file.
+
+    With ijson only the propositions are materialized, not the paragraphs,
+    items and block quotes around them; otherwise the whole file is parsed.
+    """
+    with open(parsed_json_path, 'rb') as f:
+        if ijson is not None:
+            return list(ijson.items(f, 'propositions.item', use_float=True))
+        return _json_loads(f.read()).get('propositions', [])
 
 
 def validate_brief(parsed_json_path: str, output_html_path: Optional[str] = None) -> List[PropositionValidation]:
@@ -599,27 +794,32 @@ def validate_brief(parsed_json_path: str, output_html_path: Optional[str] = None
         List of validation results
     """
     # Load parsed brief
-    with open(parsed_json_path, 'r', encoding='utf-8') as f:
-        parsed = json.load(f)
-
-    propositions = parsed.get('propositions', [])
+    propositions = load_propositions(parsed_json_path)
 
     print(f"Validating {len(propositions)} propositions...")
 
-    validations = []
-    for i, prop in enumerate(propositions, 1):
-        print(f"  [{i}/{len(propositions)}] ", end='', flush=True)
+    # Match every quote against its case up front, one scan per case
+    case_hits = prematch_quotes(propositions)
 
-        validation = validate_proposition(prop)
-        validations.append(validation)
+    def validate(prop: Dict) -> PropositionValidation:
+        cite = _local_cite(prop.get('citations', []))
+        key = (cite.get('local_json_path'), cite.get('local_html_path')) if cite else None
+        return validate_proposition(prop, case_hits.get(key))
 
-        # Print result indicator
-        if validation.result == ValidationResult.VERIFIED:
-            print("✓")
-        elif validation.result == ValidationResult.FAILED:
-            print("✗")
-        else:
-            print("?")
+    # Threads overlap the claude CLI calls; results come back in order
+    validations = []
+    with ThreadPoolExecutor(max_workers=CLAUDE_MAX_WORKERS) as executor:
+        for i, validation in enumerate(executor.map(validate, propositions), 1):
+            print(f"  [{i}/{len(propositions)}] ", end='', flush=True)
+            validations.append(validation)
+
+            # Print result indicator
+            if validation.result == ValidationResult.VERIFIED:
+                print("✓")
+            elif validation.result == ValidationResult.FAILED:
+                print("✗")
+            else:
+                print("?")
 
     # Generate HTML report
     if output_html_path is None:
@@ -628,10 +828,11 @@ def validate_brief(parsed_json_path: str, output_html_path: Optional[str] = None
     brief_name = os.path.basename(parsed_json_path).replace('_parsed.json', '')
     generate_html_report(validations, brief_name, output_html_path)
 
+    counts = Counter(v.result for v in validations)
     print(f"\nResults:")
-    print(f"  Verified: {sum(1 for v in validations if v.result == ValidationResult.VERIFIED)}")
-    print(f"  Failed: {sum(1 for v in validations if v.result == ValidationResult.FAILED)}")
-    print(f"  Uncertain: {sum(1 for v in validations if v.result == ValidationResult.UNCERTAIN)}")
+    print(f"  Verified: {counts[ValidationResult.VERIFIED]}")
+    print(f"  Failed: {counts[ValidationResult.FAILED]}")
+    print(f"  Uncertain: {counts[ValidationResult.UNCERTAIN]}")
     print(f"\nReport: {output_html_path}")
 
     return validations